@@ -0,0 +1,56 @@
+# core/key_input.py
+# ================================================================
+# KEYBOARD INPUT (terminal, Raspberry Pi safe)
+# - One daemon thread does the blocking sys.stdin.readline()
+# - Each line is normalized and pushed into key_q
+# - Callers block on the queue instead of polling select()
+# - wake() lets other threads (e.g. playback end) interrupt a wait
+# ================================================================
+
+import sys
+import queue
+import threading
+
+key_q = queue.Queue()
+
+# Queued by wake(); never returned to callers as a key
+_WAKE = object()
+
+
+def _reader_loop():
+    while True:
+        line = sys.stdin.readline()
+
+        # EOF (stdin closed) → stop reading
+        if not line:
+            break
+
+        key_q.put(line.strip().lower())
+
+    print("[KEYS] stdin closed.")
+
+
+def get_key(timeout=None):
+    """
+    Return the next typed line (stripped, lower-case).
+    Blocks up to `timeout` seconds; returns None if nothing was typed
+    or if wake() was called meanwhile. With no timeout, wake-ups are
+    ignored and only a real key returns.
+    """
+    try:
+        key = key_q.get(timeout=timeout)
+        while key is _WAKE and timeout is None:
+            key = key_q.get()
+    except queue.Empty:
+        return None
+
+    return None if key is _WAKE else key
+
+
+def wake():
+    """Make a pending get_key(timeout) return None immediately."""
+    key_q.put(_WAKE)
+
+
+# Start reader on import
+threading.Thread(target=_reader_loop, daemon=True).start()
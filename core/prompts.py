@@ -2,107 +2,121 @@
 # ================================================================
 # CENTRALIZED PROMPT AUDIO (WAV CACHED)
 # - All system prompts are generated once via speak_cached()
+# - Cache misses are synthesized in parallel at import time
 # - Ensures stable Pi playback (no MP3 decoding)
 # ================================================================
 
-from core.tts import speak_cached
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from core.tts import speak_cached, PROMPT_CACHE_DIR
 from core.utils import absolute_path
 
+# ================================================================
+# STATIC PROMPTS — name: (text, cached filename)
+# ================================================================
+STATIC_PROMPTS = {
+    # ---------------------------
+    # MAIN SYSTEM PROMPTS
+    # ---------------------------
+    "select_file_p": ("Select an image file. If you cancel, I will open the camera.", "select_file.wav"),
+    "no_file_p": ("No file selected. Opening camera.", "no_file_open_camera.wav"),
+    "no_image_exit_p": ("No image captured. Exiting.", "no_image_exit.wav"),
+    "processing_p": ("Processing the image. Please wait.", "processing_wait.wav"),
+    "empty_page_p": ("The page appears empty or unreadable.", "empty_page.wav"),
+    "all_done_p": ("Completed all sentences.", "all_sentences_done.wav"),
+    "exiting_module_p": ("Exiting reading module.", "exiting_module.wav"),
+    "return_to_reading_p": ("Returning to reading.", "return_to_reading.wav"),
+
+    # ---------------------------
+    # CAMERA PROMPTS
+    # ---------------------------
+    "camera_countdown_p": ("Hold the page steady. Capturing in three, two, one.", "camera_countdown.wav"),
+    "camera_capture_p": ("Press SPACE to capture, ESC to exit.", "camera_capture.wav"),
+    "camera_libcamera_p": ("Switching to Raspberry Pi camera mode.", "camera_libcamera.wav"),
+
+    # ---------------------------
+    # PAUSE MENU PROMPTS
+    # ---------------------------
+    "no_content_yet_p": ("No content has been read yet.", "no_content_yet.wav"),
+    "generating_summary_p": ("Generating summary.", "generating_summary.wav"),
+    "stopping_summary_p": ("Stopping summary.", "stopping_summary.wav"),
+    "back_pause_menu_p": ("Back to pause menu.", "back_pause_menu.wav"),
+
+    # ---------------------------
+    # VOICE CONTROL PROMPTS
+    # ---------------------------
+    "vc_intro_p": ("Voice control. Say summary, resume, or quit.", "voice_intro.wav"),
+    "vc_retry_p": ("I did not catch that. Please try again.", "retry_voice.wav"),
+    "vc_unknown_p": ("Unknown command. Please say summary, resume, or quit.", "unknown_command.wav"),
+    "vc_back_p": ("Back to voice control.", "back_voice.wav"),
+}
+
+
+def prewarm_prompts(max_workers: int = 8) -> dict:
+    """
+    Generate (or look up) every static prompt.
+    Cache hits are resolved inline; only misses go to the thread pool,
+    so warm runs start no threads at all.
+    Returns {prompt name: cached wav path}.
+    """
+    paths = {}
+    misses = []
+
+    for name, (text, filename) in STATIC_PROMPTS.items():
+        cached_wav = os.path.join(PROMPT_CACHE_DIR, filename)
+        if os.path.exists(cached_wav):
+            paths[name] = cached_wav
+        else:
+            misses.append(name)
+
+    if misses:
+        print(f"[PROMPTS] Generating {len(misses)} prompt(s)...")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as ex:
+            generated = ex.map(lambda n: speak_cached(*STATIC_PROMPTS[n]), misses)
+            for name, path in zip(misses, generated):
+                paths[name] = path
+
+    return paths
+
+
+# {prompt name: wav path}, e.g. PROMPTS["select_file_p"]
+PROMPTS = prewarm_prompts()
+
 # ---------------------------
 # MAIN SYSTEM PROMPTS
 # ---------------------------
-select_file_p = speak_cached(
-    "Select an image file. If you cancel, I will open the camera.",
-    "select_file.wav"
-)
-
-no_file_p = speak_cached(
-    "No file selected. Opening camera.",
-    "no_file_open_camera.wav"
-)
-
-no_image_exit_p = speak_cached(
-    "No image captured. Exiting.",
-    "no_image_exit.wav"
-)
-
-processing_p = speak_cached(
-    "Processing the image. Please wait.",
-    "processing_wait.wav"
-)
-
-empty_page_p = speak_cached(
-    "The page appears empty or unreadable.",
-    "empty_page.wav"
-)
-
-no_sentences_p = speak_cached(
-    "I could not extract readable sentences from this page.",
-    "no_sentences.wav"
-)
-
-all_done_p = speak_cached(
-    "Completed all sentences.",
-    "all_sentences_done.wav"
-)
-
-exiting_module_p = speak_cached(
-    "Exiting reading module.",
-    "exiting_module.wav"
-)
-
-return_to_reading_p = speak_cached(
-    "Returning to reading.",
-    "return_to_reading.wav"
-)
+select_file_p = PROMPTS["select_file_p"]
+no_file_p = PROMPTS["no_file_p"]
+no_image_exit_p = PROMPTS["no_image_exit_p"]
+processing_p = PROMPTS["processing_p"]
+empty_page_p = PROMPTS["empty_page_p"]
+all_done_p = PROMPTS["all_done_p"]
+exiting_module_p = PROMPTS["exiting_module_p"]
+return_to_reading_p = PROMPTS["return_to_reading_p"]
 
+# ---------------------------
+# CAMERA PROMPTS
+# ---------------------------
+camera_countdown_p = PROMPTS["camera_countdown_p"]
+camera_capture_p = PROMPTS["camera_capture_p"]
+camera_libcamera_p = PROMPTS["camera_libcamera_p"]
 
 # ---------------------------
 # PAUSE MENU PROMPTS
 # ---------------------------
-no_content_yet_p = speak_cached(
-    "No content has been read yet.",
-    "no_content_yet.wav"
-)
-
-generating_summary_p = speak_cached(
-    "Generating summary.",
-    "generating_summary.wav"
-)
-
-stopping_summary_p = speak_cached(
-    "Stopping summary.",
-    "stopping_summary.wav"
-)
-
-back_pause_menu_p = speak_cached(
-    "Back to pause menu.",
-    "back_pause_menu.wav"
-)
-
+no_content_yet_p = PROMPTS["no_content_yet_p"]
+generating_summary_p = PROMPTS["generating_summary_p"]
+stopping_summary_p = PROMPTS["stopping_summary_p"]
+back_pause_menu_p = PROMPTS["back_pause_menu_p"]
 
 # ---------------------------
 # VOICE CONTROL PROMPTS
 # ---------------------------
-vc_intro_p = speak_cached(
-    "Voice control. Say summary, resume, or quit.",
-    "voice_intro.wav"
-)
-
-vc_retry_p = speak_cached(
-    "I did not catch that. Please try again.",
-    "retry_voice.wav"
-)
-
-vc_unknown_p = speak_cached(
-    "Unknown command. Please say summary, resume, or quit.",
-    "unknown_command.wav"
-)
-
-vc_back_p = speak_cached(
-    "Back to voice control.",
-    "back_voice.wav"
-)
+vc_intro_p = PROMPTS["vc_intro_p"]
+vc_retry_p = PROMPTS["vc_retry_p"]
+vc_unknown_p = PROMPTS["vc_unknown_p"]
+vc_back_p = PROMPTS["vc_back_p"]
 
 
 # ---------------------------
@@ -2,6 +2,7 @@
 
 import os
 import time
+import queue
 import numpy as np
 import sounddevice as sd
 from google.cloud import speech
@@ -16,6 +17,17 @@ from core.logger import log
 SAMPLE_RATE = 16000
 CHANNELS = 1
 
+# ================================================================
+#  END-OF-SPEECH DETECTION (energy VAD)
+#  Mic is read in 20 ms frames; a frame with RMS above the
+#  threshold counts as speech. Recording stops once speech has been
+#  followed by VAD_TRAILING_SILENCE seconds of quiet.
+# ================================================================
+FRAME_MS = 20
+FRAME_SAMPLES = SAMPLE_RATE * FRAME_MS // 1000
+VAD_RMS_THRESHOLD = float(os.getenv("STT_VAD_RMS", "500"))
+VAD_TRAILING_SILENCE = 0.5
+
 
 # ================================================================
 #  GOOGLE CREDENTIALS
@@ -51,28 +63,75 @@ init_stt()
 # ================================================================
 def record_audio(duration=4):
     """
-    Records audio using ALSA (sounddevice).
+    Records audio using ALSA (sounddevice) until the speaker stops:
+    ends after VAD_TRAILING_SILENCE s of silence following speech,
+    or after `duration` seconds at most.
     Returns raw PCM bytes.
     """
 
-    print(f"[STT] Recording {duration}s...")
+    print(f"[STT] Recording (up to {duration}s)...")
+
+    max_frames = int(duration * 1000 / FRAME_MS)
+    silence_limit = int(VAD_TRAILING_SILENCE * 1000 / FRAME_MS)
+
+    # Pre-allocated PCM buffer; the callback writes each frame straight
+    # into it and queues only its (start, end) sample offsets
+    pcm = np.empty(max_frames * FRAME_SAMPLES * CHANNELS, dtype=np.int16)
+    written = 0
+    frames_q = queue.Queue()
+
+    def _on_frame(indata, frames, time_info, status):
+        nonlocal written
+        # Raw stream: indata is a CFFI buffer of int16 PCM (no copy here)
+        samples = np.frombuffer(indata, dtype=np.int16)
+        start = written
+        end = min(start + len(samples), len(pcm))
+        pcm[start:end] = samples[:end - start]
+        written = end
+        frames_q.put((start, end))
+
+    heard_speech = False
+    silent = 0
 
     try:
-        audio = sd.rec(
-            int(duration * SAMPLE_RATE),
+        with sd.RawInputStream(
             samplerate=SAMPLE_RATE,
             channels=CHANNELS,
-            dtype="int16"
-        )
-        sd.wait()
+            dtype="int16",
+            blocksize=FRAME_SAMPLES,
+            callback=_on_frame,
+        ):
+            end = 0
+            while end < len(pcm):
+                try:
+                    start, end = frames_q.get(timeout=1.0)
+                except queue.Empty:
+                    # Device stopped delivering frames: keep what we have
+                    log("STT", "-", "Microphone stalled; using audio captured so far")
+                    break
+
+                frame = pcm[start:end]
+                rms = np.sqrt(np.mean(np.square(frame, dtype=np.float32)))
+                if rms >= VAD_RMS_THRESHOLD:
+                    heard_speech = True
+                    silent = 0
+                elif heard_speech:
+                    silent += 1
+                    if silent >= silence_limit:
+                        break
 
     except Exception as e:
-        log("STT", "-", f"Microphone error: {e}")
-        print(f"[STT] Microphone error: {e}")
+        log("STT", "-", f"Microphone error: {e!r}")
+        print(f"[STT] Microphone error: {e!r}")
+        return None
+
+    # Stream is closed, so the callback has stopped writing
+    if not written:
         return None
 
-    print("[STT] Recording complete.")
-    return audio.tobytes()
+    print(f"[STT] Recording complete ({written / (CHANNELS * SAMPLE_RATE):.1f}s).")
+    # Single copy out (protobuf bytes fields need bytes)
+    return pcm[:written].tobytes()
 
 
 # ================================================================
@@ -3,7 +3,6 @@
 # STT COMMAND NORMALIZATION + RETRY LOGIC
 # ================================================================
 
-import time
 from core.stt import listen
 from core.prompts import vc_retry_p
 from core.tts_player import tts_main    # use tts_main as unified prompt engine
@@ -59,12 +58,7 @@ def listen_for_command(max_attempts=3):
         if attempts < max_attempts:
             # Play retry prompt
             tts_main.stop()
-            time.sleep(1.0)
-
             tts_main.play(vc_retry_p)
-            while tts_main.is_playing():
-                time.sleep(0.05)
-
-            time.sleep(1.0)
+            tts_main.wait_done()
 
     return None
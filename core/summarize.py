@@ -1,8 +1,9 @@
 import os
 import sys
 import time
+import threading
+from collections import deque
 from dotenv import load_dotenv
-import google.generativeai as genai
 from core.tts import speak
 from core.logger import log
 
@@ -11,7 +12,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from core.utils import absolute_path, ensure_dir
+from core.utils import absolute_path, ensure_dir, get_gemini_model
 from core.logger import log
 
 load_dotenv()
@@ -25,37 +26,38 @@ GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")  # fallback
 if not GEMINI_API_KEY:
     raise ValueError("Gemini API key missing. Set GEMINI_API_KEY in .env")
 
-genai.configure(api_key=GEMINI_API_KEY)
-
-
 # ================================================================
 # SUMMARY FUNCTION
 # ================================================================
-def summarize(text: str) -> str:
+def summarize(text: str, max_words: int = None, notify: bool = True) -> str:
     """
     Summarizes a block of text using Gemini.
+    max_words defaults to a quarter of the input length; with
+    notify=False, errors are only logged, not spoken.
     Returns summary string.
     """
-
     if not text or len(text.strip()) == 0:
         return "No text provided."
 
+    if max_words is None:
+        max_words = int(len(text) / 4)
+
     prompt = f"""
     You are an AI summarizer. Summarize the following text clearly and concisely
-    without changing the meaning ({int(len(text) / 4)} words max):
+    without changing the meaning ({max_words} words max):
 
     TEXT:
     \"\"\"{text}\"\"\"
     """
 
     t0 = time.time()
-    model = genai.GenerativeModel(GEMINI_MODEL)
 
     try:
-        response = model.generate_content(prompt)
+        response = get_gemini_model(GEMINI_API_KEY, GEMINI_MODEL).generate_content(prompt)
     except Exception as e:
         log("SUMMARY", "-", f"Gemini error: {e}")
-        speak(f"Gemini error: {e}")
+        if notify:
+            speak(f"Gemini error: {e}")
         return f"Gemini error: {e}"
 
     summary_text = getattr(response, "text", "")
@@ -66,6 +68,82 @@ def summarize(text: str) -> str:
     return summary_text
 
 
+# ================================================================
+# ROLLING CONTEXT (bounded summary input)
+# ================================================================
+class RollingContext:
+    """
+    Keeps what has been read so far in a bounded form:
+    a running summary of older sentences + the last k sentences.
+
+    Every k sentences the backlog is folded into the running summary
+    on a background thread, so summarize() always gets compact input
+    no matter how many pages have been read. After a failed fold the
+    backlog is trimmed to max_recent sentences (oldest dropped), and
+    the retry waits until it reaches the next multiple of k above that
+    length, so a retry never sends more than max_recent + k sentences.
+    """
+
+    # Word budget of the running summary, independent of backlog size
+    FOLD_MAX_WORDS = 150
+
+    def __init__(self, k: int = 200, max_recent: int = 800):
+        self.k = k
+        self.max_recent = max_recent
+        self.recent = deque()
+        self.running_summary = ""
+        self._lock = threading.Lock()
+        self._folding = False
+        self._next_fold = k    # backlog size that triggers the next fold
+
+    def __bool__(self):
+        return bool(self.recent) or bool(self.running_summary)
+
+    def add(self, sentence: str):
+        with self._lock:
+            self.recent.append(sentence)
+            start_fold = len(self.recent) >= self._next_fold and not self._folding
+            if start_fold:
+                self._folding = True
+                snapshot = self._text_unlocked()
+                folded = len(self.recent)
+
+        if start_fold:
+            threading.Thread(
+                target=self._fold,
+                args=(snapshot, folded),
+                daemon=True,
+            ).start()
+
+    def _text_unlocked(self) -> str:
+        return (self.running_summary + " " + " ".join(self.recent)).strip()
+
+    def text(self) -> str:
+        with self._lock:
+            return self._text_unlocked()
+
+    def _fold(self, snapshot: str, folded: int):
+        try:
+            new_summary = summarize(snapshot, max_words=self.FOLD_MAX_WORDS, notify=False)
+        except Exception as e:
+            log("SUMMARY", "-", f"Rolling fold error: {e}")
+            new_summary = ""
+
+        with self._lock:
+            # summarize() reports Gemini failures as text; keep the
+            # sentences and retry at the next multiple of k
+            if new_summary and not new_summary.startswith("Gemini error"):
+                self.running_summary = new_summary
+                for _ in range(folded):
+                    self.recent.popleft()
+                self._next_fold = self.k
+            else:
+                while len(self.recent) > self.max_recent:
+                    self.recent.popleft()
+                self._next_fold = (len(self.recent) // self.k + 1) * self.k
+            self._folding = False
+
+
 # ================================================================
 # CLI MODE (python summarize.py "text here")
 # ================================================================
@@ -2,10 +2,29 @@
 # ================================================================
 #  TEXT UTILITIES
 #  - Sentence splitting with forgiving behavior for OCR'd text
+#  - Incremental splitting for streamed text (e.g. Gemini chunks)
+#  - Text normalization shared with the TTS cache keys
 # ================================================================
 
 import re
-from typing import List
+from typing import Iterable, Iterator, List
+
+# Sentence-ending punctuation followed by whitespace (compiled once)
+_BOUNDARY_RE = re.compile(r'(?<=[.!?;])[\r\n\s]+')
+
+_SPACE_RE = re.compile(r"\s+")
+
+# Curly quotes → straight quotes
+_QUOTES = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonical form of a sentence: straight quotes, single spaces,
+    no surrounding whitespace. Used before synthesis and before
+    hashing, so cosmetic differences never miss the TTS cache.
+    """
+    return _SPACE_RE.sub(" ", text.translate(_QUOTES)).strip()
 
 
 def split_into_sentences(text: str, min_len: int = 10, max_len: int = 50) -> List[str]:
@@ -14,7 +33,7 @@ def split_into_sentences(text: str, min_len: int = 10, max_len: int = 50) -> Lis
 
     Forgiving behavior:
     - Split on ., ?, ! followed by whitespace
-    - Strip whitespace around each piece
+    - Normalize each piece (see normalize_text)
     - Drop completely empty chunks
     - Merge very short fragments (len < min_len) into the previous sentence
       to reduce OCR-induced fragmentation.
@@ -26,30 +45,63 @@ def split_into_sentences(text: str, min_len: int = 10, max_len: int = 50) -> Lis
     if not text:
         return []
 
-    # Basic split on sentence-ending punctuation + whitespace
-    raw_chunks = re.split(r'(?<=[.!?;])[\r\n\s]+', text)
+    return list(stream_sentences([text], min_len, max_len))
 
-    # Clean up whitespace and remove empties
-    cleaned = [chunk.strip() for chunk in raw_chunks if chunk and chunk.strip()]
 
-    if not cleaned:
-        return []
+def stream_sentences(chunks: Iterable[str], min_len: int = 10, max_len: int = 50) -> Iterator[str]:
+    """
+    Incremental version of split_into_sentences().
 
-    sentences: List[str] = []
+    Consumes text chunks as they arrive and yields each sentence as soon
+    as the one after it has started, so short OCR fragments can still be
+    merged into it. The final sentence is yielded when chunks run out.
+    """
+    buf = ""
+    pending = None
 
-    for chunk in cleaned:
-        # If this is the first chunk, just add it
-        if not sentences:
-            sentences.append(chunk)
-            continue
+    def _feed(piece):
+        # Returns a finished sentence (or None) and updates pending
+        nonlocal pending
+        piece = normalize_text(piece)
+        if not piece:
+            return None
+
+        # If this is the first chunk, just hold it
+        if pending is None:
+            pending = piece
+            return None
 
         # If the chunk is very short (likely OCR noise), merge into previous
-        if len(chunk) < min_len and len(chunk) + len(sentences[-1]) < max_len:
-            sentences[-1] = sentences[-1] + " " + chunk
-        else:
-            sentences.append(chunk)
+        if len(piece) < min_len and len(piece) + len(pending) < max_len:
+            pending = pending + " " + piece
+            return None
+
+        done, pending = pending, piece
+        return done
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        buf += chunk
+
+        # Walk boundaries lazily instead of building a split() list
+        start = 0
+        for m in _BOUNDARY_RE.finditer(buf):
+            done = _feed(buf[start:m.start()])
+            if done:
+                yield done
+            start = m.end()
+
+        # Text after the last boundary may still be an incomplete sentence
+        buf = buf[start:]
+
+    done = _feed(buf)
+    if done:
+        yield done
 
-    return sentences
+    if pending:
+        yield pending
 
 
 if __name__ == "__main__":
@@ -1,14 +1,21 @@
 # core/tts.py
 # ================================================================
 # GOOGLE CLOUD TEXT-TO-SPEECH (Cleaned Version)
-# - Generates WAV files only (LINEAR16 PCM)
+# - Prompts: WAV (LINEAR16 PCM)
+# - speak() + sentence cache: Ogg Opus (~10x smaller download + file)
+# - Content-addressed: identical text is synthesized once
 # - No playback, no blocking logic
 # - All prompts cached as WAV for Pi stability
 # ================================================================
 
+import io
 import os
+import html
 import time
-import datetime
+import hashlib
+import threading
+import functools
+import itertools
 import soundfile as sf
 
 from google.cloud import texttospeech
@@ -16,15 +23,35 @@ from google.oauth2 import service_account
 
 from core.utils import absolute_path, ensure_dir, load_credential_path
 from core.logger import log
+from core.text_utils import normalize_text
 
 # ================================================================
 # DIRECTORIES
 # ================================================================
 AUDIO_DIR = absolute_path("results", "audio_outputs")
 PROMPT_CACHE_DIR = absolute_path("results", "prompt_cache")
+SENTENCE_CACHE_DIR = absolute_path("results", "prompt_cache", "sentences")
+
+# Sentence cache size cap (least recently used files evicted first)
+SENTENCE_CACHE_MAX_BYTES = int(os.getenv("SENTENCE_CACHE_MAX_MB", "200")) * 1024 * 1024
+
+# Voice used for every request; part of every cache key, so changing
+# it never replays audio made with the old voice
+VOICE_LANGUAGE = "en-US"
+VOICE_GENDER = "NEUTRAL"
+_VOICE_TAG = f"{VOICE_LANGUAGE}|{VOICE_GENDER}"
+
+# Format of the content-addressed caches (speak() + sentences):
+# compressed, decoded by soundfile at playback
+CACHE_ENCODING = texttospeech.AudioEncoding.OGG_OPUS
+CACHE_EXT = ".opus"
 
 ensure_dir(AUDIO_DIR)
 ensure_dir(PROMPT_CACHE_DIR)
+ensure_dir(SENTENCE_CACHE_DIR)
+
+# Per-process sequence so parallel speak() calls never share a temp file
+_SEQ = itertools.count()
 
 # ================================================================
 # GOOGLE CREDENTIALS
@@ -47,6 +74,22 @@ def init_tts():
 init_tts()
 
 
+def _prewarm_client():
+    """
+    Open the gRPC channel and fetch the OAuth token in the background,
+    so the first real synthesis skips the handshake. list_voices is
+    free and goes over the same channel as synthesize_speech.
+    """
+    try:
+        tts_client.list_voices(language_code=VOICE_LANGUAGE)
+    except Exception as e:
+        log("TTS", "-", f"Client pre-warm failed: {e}")
+
+
+if tts_client:
+    threading.Thread(target=_prewarm_client, daemon=True).start()
+
+
 # ================================================================
 # speak_cached()
 # - Generate once → store WAV → reuse always
@@ -55,7 +98,7 @@ init_tts()
 def speak_cached(text: str, filename: str):
     """
     Generate TTS audio for a prompt ONCE, store as WAV, and reuse thereafter.
-    Ensures Pi-safe audio playback with no MP3 decoding.
+    Ensures Pi-safe audio playback with no compressed decoding.
     """
     cached_wav = os.path.join(PROMPT_CACHE_DIR, filename)
 
@@ -63,35 +106,247 @@ def speak_cached(text: str, filename: str):
     if os.path.exists(cached_wav):
         return cached_wav
 
-    # Generate speech
-    generated_path = speak(text)
+    # Synthesize straight to LINEAR16 WAV (speak() now caches Opus,
+    # and prompts stay plain PCM for Pi stability)
+    path = _synthesize(normalize_text(text), cached_wav)
+
+    if path is None:
+        print("[speak_cached] ERROR: synthesis returned no audio.")
 
-    if not generated_path or not os.path.exists(generated_path):
-        print("[speak_cached] ERROR: speak() returned no audio.")
+    return path
+
+
+# ================================================================
+# speak_cached_sentence()
+# - Content-addressed cache for arbitrary text (sentences, summaries)
+# - Key = sha256(voice, text) → results/prompt_cache/sentences/<key>.opus
+# ================================================================
+def speak_cached_sentence(text: str):
+    """
+    Return cached audio for this (normalized) text, synthesizing it on a miss.
+    Hits refresh the file's access time for LRU eviction.
+    """
+    text = normalize_text(text)
+    cached = _sentence_path(text)
+
+    if _cache_hit(cached):
+        return cached
+
+    # Synthesize straight into the LRU-managed cache (not via speak(),
+    # so sentence audio is stored once and eviction really frees space)
+    if _synthesize(text, cached, CACHE_ENCODING) is None:
         return None
 
-    # Convert to WAV PCM int16 (safe for Pi)
+    _evict_sentence_cache([cached])
+    return cached
+
+
+def _sentence_path(text: str):
+    key = hashlib.sha256(f"{_VOICE_TAG}|{text}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(SENTENCE_CACHE_DIR, f"{key}{CACHE_EXT}")
+
+
+def _cache_hit(path: str):
+    """True if path exists; refreshes its access time for LRU eviction."""
+    if not os.path.exists(path):
+        return False
     try:
-        data, samplerate = sf.read(generated_path, dtype="int16")
-        sf.write(cached_wav, data, samplerate, format="WAV")
-    except Exception as e:
-        print(f"[speak_cached] ERROR converting to WAV: {e}")
-        # Fallback: use the generated WAV (unlikely to fail)
-        return generated_path
+        os.utime(path)
+    except OSError:
+        pass
+    return True
+
+
+# ================================================================
+# speak_cached_batch()
+# - Several sentences → one Google TTS request (SSML with <mark/>s)
+# - Audio is sliced at the mark timepoints into per-sentence files,
+#   stored in the same sentence cache as speak_cached_sentence()
+# ================================================================
+BATCH_MAX_CHARS = 500
+
+
+def speak_cached_batch(texts):
+    """
+    Return cached audio paths for texts (None where synthesis failed).
+    Cache misses are grouped into requests of up to BATCH_MAX_CHARS;
+    a batch that cannot be split falls back to one request per text.
+    """
+    texts = [normalize_text(t) for t in texts]
+    paths = [_sentence_path(t) for t in texts]
+
+    # A concurrent miss elsewhere must not evict this batch's files
+    # while it is still being synthesized
+    pinned = list(paths)
+    _pin(pinned)
+    try:
+        misses = [i for i, p in enumerate(paths) if not _cache_hit(p)]
+
+        if not misses:
+            return paths
+
+        # Group consecutive misses under the size limit
+        batches = [[]]
+        size = 0
+        for i in misses:
+            if batches[-1] and size + len(texts[i]) > BATCH_MAX_CHARS:
+                batches.append([])
+                size = 0
+            batches[-1].append(i)
+            size += len(texts[i])
+
+        for batch in batches:
+            if len(batch) > 1 and _synthesize_marked(
+                [texts[i] for i in batch], [paths[i] for i in batch]
+            ):
+                continue
+            for i in batch:
+                if _synthesize(texts[i], paths[i], CACHE_ENCODING) is None:
+                    paths[i] = None
+
+        _evict_sentence_cache([paths[i] for i in misses if paths[i]])
+        return paths
+    finally:
+        _unpin(pinned)
+
+
+# Running size of the sentence cache in bytes (None until the first
+# scan); the directory is only rescanned once it passes the cap
+_sentence_cache_bytes = None
+_sentence_cache_lock = threading.Lock()
+
+# path → number of batches in flight using it (never evicted)
+_pinned = {}
+
+
+def _pin(paths):
+    with _sentence_cache_lock:
+        for p in paths:
+            _pinned[p] = _pinned.get(p, 0) + 1
+
+
+def _unpin(paths):
+    with _sentence_cache_lock:
+        for p in paths:
+            if _pinned[p] > 1:
+                _pinned[p] -= 1
+            else:
+                del _pinned[p]
+
+
+def _scan_sentence_cache():
+    """[(atime, size, path)] of every file in the sentence cache."""
+    entries = []
+    for e in os.scandir(SENTENCE_CACHE_DIR):
+        if e.is_file():
+            st = e.stat()
+            entries.append((st.st_atime, st.st_size, e.path))
+    return entries
+
+
+def _evict_sentence_cache(added):
+    """
+    Add the newly written files (added) to the running cache size and,
+    once it exceeds SENTENCE_CACHE_MAX_BYTES, delete least recently used
+    sentence files until the cache fits again. Pinned paths are kept.
+    """
+    global _sentence_cache_bytes
+
+    with _sentence_cache_lock:
+        try:
+            if _sentence_cache_bytes is None:
+                # First call: the scan already includes the added files
+                _sentence_cache_bytes = sum(size for _, size, _ in _scan_sentence_cache())
+            else:
+                _sentence_cache_bytes += sum(os.path.getsize(p) for p in added)
+
+            if _sentence_cache_bytes <= SENTENCE_CACHE_MAX_BYTES:
+                return
+
+            entries = _scan_sentence_cache()
+        except OSError as e:
+            print(f"[speak_cached_sentence] ERROR scanning cache: {e}")
+            return
 
-    return cached_wav
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= SENTENCE_CACHE_MAX_BYTES:
+                break
+            if path in _pinned:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+        _sentence_cache_bytes = total
 
 
 # ================================================================
 # speak()
-# - Generate TTS WAV
+# - Generate TTS audio (Ogg Opus), content-addressed:
+#   tts_<sha1(voice, text)>.opus
+# - Same text → same file, synthesized at most once
 # - No playback logic inside
-# - Returns path for TTSPlayer
+# - Returns path for TTSPlayer (speak_bytes(): the encoded bytes)
 # ================================================================
+class _SynthesisFailed(Exception):
+    """Raised inside the memo so failures are not cached."""
+
+
 def speak(text: str):
     """
     Convert text → speech using Google Cloud TTS.
-    Returns the path to the generated WAV.
+    Returns the path to the generated audio (reused if already on disk).
+    """
+    try:
+        return _speak_memo(normalize_text(text))
+    except _SynthesisFailed:
+        return None
+
+
+def speak_bytes(text: str):
+    """
+    Like speak(), but returns the audio bytes for TTSPlayer.play().
+    Freshly synthesized audio is handed back from memory (the file is
+    still written for next time); only cache hits are read from disk.
+    """
+    text = normalize_text(text)
+    audio_path = _speak_path(text)
+
+    if os.path.exists(audio_path):
+        with open(audio_path, "rb") as f:
+            return f.read()
+
+    return _synthesize(text, audio_path, CACHE_ENCODING, return_bytes=True)
+
+
+def _speak_path(text: str):
+    key = hashlib.sha1(f"{_VOICE_TAG}|{text}".encode("utf-8")).hexdigest()
+    return os.path.join(AUDIO_DIR, f"tts_{key}{CACHE_EXT}")
+
+
+@functools.lru_cache(maxsize=512)
+def _speak_memo(text: str):
+    # In-process memo: repeat texts skip even the os.path.exists stat
+    audio_path = _speak_path(text)
+
+    if os.path.exists(audio_path):
+        return audio_path
+
+    path = _synthesize(text, audio_path, CACHE_ENCODING)
+    if path is None:
+        raise _SynthesisFailed()
+    return path
+
+
+def _synthesize(text: str, audio_path: str,
+                encoding=texttospeech.AudioEncoding.LINEAR16,
+                return_bytes=False):
+    """
+    Synthesize text into audio_path.
+    Returns the path, or the audio bytes if return_bytes; None on error.
     """
     if not tts_client:
         print("[TTS] Client not initialized.")
@@ -102,14 +357,12 @@ def speak(text: str):
     synthesis_input = texttospeech.SynthesisInput(text=text)
 
     voice = texttospeech.VoiceSelectionParams(
-        language_code="en-US",
-        ssml_gender=texttospeech.SsmlVoiceGender.NEUTRAL,
+        language_code=VOICE_LANGUAGE,
+        ssml_gender=texttospeech.SsmlVoiceGender[VOICE_GENDER],
     )
 
-    audio_config = texttospeech.AudioConfig(
-        # Output directly as WAV (LINEAR16 PCM)
-        audio_encoding=texttospeech.AudioEncoding.LINEAR16
-    )
+    # LINEAR16 comes back as a complete WAV file, OGG_OPUS as Ogg
+    audio_config = texttospeech.AudioConfig(audio_encoding=encoding)
 
     # Generate TTS
     try:
@@ -122,14 +375,13 @@ def speak(text: str):
         log("TTS", "-", f"TTS ERROR: {e}")
         return None
 
-    # Output filename
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    audio_path = absolute_path("results", "audio_outputs", f"tts_{ts}.wav")
-
-    # Save WAV bytes
+    # Save audio bytes via a unique temp file + atomic rename, so parallel
+    # speak() calls for the same text never expose a half-written file
+    tmp_path = f"{audio_path}.{next(_SEQ)}.tmp"
     try:
-        with open(audio_path, "wb") as f:
+        with open(tmp_path, "wb") as f:
             f.write(response.audio_content)
+        os.replace(tmp_path, audio_path)
         print(f"[TTS] Audio written: {audio_path}")
     except Exception as e:
         log("TTS", "-", f"File write error: {e}")
@@ -138,4 +390,85 @@ def speak(text: str):
     t1 = time.time()
     log("TTS", audio_path, f"Generated {len(text)} chars", round(t1 - t0, 2))
 
-    return audio_path
+    return response.audio_content if return_bytes else audio_path
+
+
+# ================================================================
+# SSML mark synthesis (used by speak_cached_batch)
+# - Time pointing is only exposed by the v1beta1 API
+# ================================================================
+_beta_client = None
+
+
+def _get_beta_client():
+    global _beta_client
+    if _beta_client is None:
+        from google.cloud import texttospeech_v1beta1
+
+        creds = service_account.Credentials.from_service_account_file(CRED_PATH)
+        _beta_client = texttospeech_v1beta1.TextToSpeechClient(credentials=creds)
+    return _beta_client
+
+
+def _synthesize_marked(texts, audio_paths):
+    """
+    Synthesize texts in ONE request, with an SSML mark after each,
+    and write each text's slice of the audio to its audio_path
+    (Ogg Opus, re-encoded from the LINEAR16 needed for slicing).
+    Returns True on success, False if the caller should fall back.
+    """
+    from google.cloud import texttospeech_v1beta1 as tts_beta
+
+    t0 = time.time()
+
+    ssml = "<speak>" + "".join(
+        f'{html.escape(t)}<mark name="s{i}"/>' for i, t in enumerate(texts)
+    ) + "</speak>"
+
+    try:
+        response = _get_beta_client().synthesize_speech(
+            request=tts_beta.SynthesizeSpeechRequest(
+                input=tts_beta.SynthesisInput(ssml=ssml),
+                voice=tts_beta.VoiceSelectionParams(
+                    language_code=VOICE_LANGUAGE,
+                    ssml_gender=tts_beta.SsmlVoiceGender[VOICE_GENDER],
+                ),
+                audio_config=tts_beta.AudioConfig(
+                    audio_encoding=tts_beta.AudioEncoding.LINEAR16
+                ),
+                enable_time_pointing=[
+                    tts_beta.SynthesizeSpeechRequest.TimepointType.SSML_MARK
+                ],
+            )
+        )
+        data, samplerate = sf.read(io.BytesIO(response.audio_content), dtype="int16")
+    except Exception as e:
+        log("TTS", "-", f"Batch TTS ERROR: {e}")
+        return False
+
+    marks = {tp.mark_name: tp.time_seconds for tp in response.timepoints}
+    if len(marks) != len(texts):
+        log("TTS", "-", f"Batch TTS: {len(marks)}/{len(texts)} marks returned")
+        return False
+
+    # Sentence i spans [end of i-1, mark i]; the last keeps the tail
+    start = 0
+    for i, path in enumerate(audio_paths):
+        if i == len(texts) - 1:
+            end = len(data)
+        else:
+            end = int(marks[f"s{i}"] * samplerate)
+
+        tmp_path = f"{path}.{next(_SEQ)}.tmp"
+        try:
+            sf.write(tmp_path, data[start:end], samplerate, format="OGG", subtype="OPUS")
+            os.replace(tmp_path, path)
+        except Exception as e:
+            log("TTS", "-", f"File write error: {e}")
+            return False
+        start = end
+
+    t1 = time.time()
+    log("TTS", "-", f"Generated {len(texts)} sentences in one request", round(t1 - t0, 2))
+
+    return True
@@ -2,13 +2,16 @@
 # ================================================================
 # TTS PLAYER (Simplified + Hardened for Raspberry Pi)
 # - Non-blocking PCM playback using sounddevice
-# - Supports: play(), stop(), is_playing()
+# - Plays WAV/Ogg files or their in-memory bytes (soundfile decode)
+# - Supports: play(), stop(), is_playing(), wait_done()
 # - No pause/resume; higher-level logic restarts sentences
 # - Designed for universal flush (all engines stop before new play)
+# - wait_done() returns only after the device has drained/closed,
+#   so callers need no fixed "let ALSA settle" sleeps
 # ================================================================
 
+import io
 import os
-import time
 import threading
 import sounddevice as sd
 import soundfile as sf
@@ -19,22 +22,40 @@ class TTSPlayer:
         self._thread = None
         self._stop_flag = False
 
+        # Set whenever nothing is playing; cleared by play()
+        self._done = threading.Event()
+        self._done.set()
+
+        # Optional no-arg callback run when a playback ends
+        self.on_done = None
+
     # ------------------------------------------------------------
     # Check if playing
     # ------------------------------------------------------------
     def is_playing(self):
         return self._thread is not None and self._thread.is_alive()
 
+    # ------------------------------------------------------------
+    # Block until playback finishes (no polling)
+    # ------------------------------------------------------------
+    def wait_done(self, timeout=None):
+        """
+        Block until the current playback finishes or is stopped.
+        Returns True if playback is done, False on timeout.
+        """
+        return self._done.wait(timeout)
+
     # ------------------------------------------------------------
     # Internal threaded playback loop
     # ------------------------------------------------------------
-    def _playback_loop(self, audio_path: str):
+    def _playback_loop(self, source, done: threading.Event):
         try:
-            data, samplerate = sf.read(audio_path, dtype="int16")
+            data, samplerate = sf.read(source, dtype="int16")
         except Exception as e:
             print(f"[TTSPlayer] ERROR loading audio: {e}")
             self._thread = None
             self._stop_flag = False
+            done.set()
             return
 
         # Force shape: (frames, channels)
@@ -66,32 +87,51 @@ class TTSPlayer:
 
                     frame_index = chunk_end
 
+                # Leaving the context drains the device (stream.stop()),
+                # so done is only signalled once ALSA has played out.
+                # On an explicit stop, drop the pending buffers instead.
+                if self._stop_flag:
+                    stream.abort()
+
         finally:
             # reset state
             self._stop_flag = False
             self._thread = None
+            done.set()
+            if self.on_done:
+                self.on_done()
             print("[TTSPlayer] Streaming finished.")
 
     # ------------------------------------------------------------
     # Public API: play
     # ------------------------------------------------------------
-    def play(self, audio_path: str):
+    def play(self, audio):
         """
         Start audio playback in a background thread.
+        `audio` is a WAV/Ogg path or the file's bytes (played from
+        memory, no disk read).
         Any existing playback is fully stopped first.
         """
-        if not isinstance(audio_path, str) or not os.path.isfile(audio_path):
-            print("[TTSPlayer] Invalid path passed to play()")
+        if isinstance(audio, (bytes, bytearray)):
+            source = io.BytesIO(audio)
+        elif isinstance(audio, (str, os.PathLike)) and os.path.isfile(audio):
+            source = audio
+        else:
+            print("[TTSPlayer] Invalid audio passed to play()")
             return
 
-        # Ensure no old audio is running
+        # Ensure no old audio is running (stop() joins the old thread,
+        # so no settle sleep is needed here)
         self.stop()
-        time.sleep(0.02)
 
         self._stop_flag = False
+
+        # Fresh event per playback so a finishing old thread
+        # can never signal the new one as done
+        self._done = threading.Event()
         self._thread = threading.Thread(
             target=self._playback_loop,
-            args=(audio_path,),
+            args=(source, self._done),
             daemon=True,
         )
         self._thread.start()
@@ -115,6 +155,22 @@ class TTSPlayer:
 
         self._thread = None
         self._stop_flag = False
+        self._done.set()
+
+
+# ================================================================
+# Device warm-up
+# ================================================================
+def warm_up_output():
+    """
+    Open and close the default output device once so the first real
+    playback does not pay ALSA/PortAudio device setup (or glitch).
+    """
+    try:
+        with sd.OutputStream(channels=1, dtype="int16"):
+            pass
+    except Exception as e:
+        print(f"[TTSPlayer] Output warm-up failed: {e}")
 
 
 # ================================================================
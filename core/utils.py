@@ -34,16 +34,62 @@ def load_credential_path(module_folder: str, filename: str) -> str:
 # ================================================================
 #  DIRECTORY ENSURER
 # ================================================================
+# Paths already created in this process (skip repeat makedirs syscalls)
+_ENSURED = set()
+
+
 def ensure_dir(path: str):
     """
     Creates a folder safely on all OS (including RPi).
+    Each path is only created once per process.
     """
+    if path in _ENSURED:
+        return
+
     try:
         os.makedirs(path, exist_ok=True)
+        _ENSURED.add(path)
     except Exception as e:
         print(f"[UTIL] Could not create directory {path}: {e}", file=sys.stderr)
 
 
+# ================================================================
+#  SHARED HANDLES (created on first use, reused process-wide)
+# ================================================================
+_tk_root = None
+
+# Gemini model name → GenerativeModel
+_GEMINI_MODELS = {}
+
+
+def get_tk_root():
+    """Hidden Tk root, created on first use and reused for every dialog."""
+    global _tk_root
+    if _tk_root is None:
+        import atexit
+        import tkinter as tk
+
+        _tk_root = tk.Tk()
+        _tk_root.attributes("-topmost", True)
+        _tk_root.withdraw()
+        atexit.register(_tk_root.destroy)
+    return _tk_root
+
+
+def get_gemini_model(api_key: str, model_name: str):
+    """
+    Gemini model handle for model_name; genai is imported and
+    configured on the first call.
+    """
+    model = _GEMINI_MODELS.get(model_name)
+    if model is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        model = _GEMINI_MODELS[model_name] = genai.GenerativeModel(model_name)
+    return model
+
+
 # ================================================================
 #  DEBUGGING OPTIONAL
 # ================================================================
@@ -1,28 +1,36 @@
 import os
 import sys
+import atexit
+import shutil
 import subprocess
-import cv2
 import time
-import datetime
-import select
-import tkinter as tk
-from tkinter import filedialog
-from PIL import Image
-import io
+import itertools
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-import google.generativeai as genai
+
+# Heavy modules (cv2, tkinter, google.generativeai) are imported
+# inside the functions that use them, so the first prompt plays
+# without waiting on their import time.
+
+try:
+    from picamera2 import Picamera2
+except ImportError:
+    Picamera2 = None
 
 # Ensure project root is in sys.path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from core.utils import absolute_path, ensure_dir, load_credential_path
-from core.tts import speak
-from core.tts_player import tts_main, tts_summary     # tts_prompt no longer needed
+from core.utils import absolute_path, ensure_dir, load_credential_path, get_tk_root, get_gemini_model
+from core.tts import speak, speak_cached_sentence, speak_cached_batch, BATCH_MAX_CHARS
+from core.tts_player import tts_main, tts_summary, warm_up_output     # tts_prompt no longer needed
 from core.logger import log
-from core.text_utils import split_into_sentences
-from core.summarize import summarize
+from core.key_input import get_key, wake
+from core.text_utils import stream_sentences
+from core.summarize import summarize, RollingContext
 
 # NEW CLEAN PROMPTS MODULE
 from core.prompts import *
@@ -36,92 +44,266 @@ CRED_PATH = load_credential_path("reading", "reading-key.json")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL")
 
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
-
+# Camera preview window (off by default: the user is blind and
+# rendering frames costs significant CPU on the Pi)
+SHOW_PREVIEW = os.getenv("SHOW_PREVIEW") == "1"
 
 # ================================================================
 # HELPERS
 # ================================================================
+def _speak_bytes_batch(texts):
+    """
+    Synthesize (or fetch cached) audio for several sentences — misses
+    in one TTS request — and return their encoded audio bytes, so playback and
+    replays never go back to the SD card.
+    """
+    paths = speak_cached_batch(texts)
+    return [_read_bytes(p, t) for p, t in zip(paths, texts)]
+
+
+def _read_bytes(path, text):
+    """
+    Audio bytes of a cached sentence file. If another batch evicted it
+    before it could be read, the sentence is synthesized again
+    (None if that fails too).
+    """
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        log("READING", "-", "Sentence audio evicted before playback; re-synthesizing")
+
+    path = speak_cached_sentence(text)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as e:
+        log("READING", "-", f"Sentence audio unreadable: {e}")
+        return None
+
+
+def announce(prompt, timeout=None):
+    """
+    Flush all channels, play prompt on tts_main and wait for it to
+    finish (at most `timeout` seconds).
+    """
+    _reset_audio()
+    tts_main.play(prompt)
+    tts_main.wait_done(timeout)
+
+
+def _reset_audio():
+    """
+    Stop whichever channels are actually playing (stop() already joins
+    the playback thread). No-op when everything is idle.
+    """
+    for c in (tts_main, tts_summary):
+        if c.is_playing():
+            c.stop()
+
+
+# Background TTS synthesis for upcoming sentences
+tts_pool = ThreadPoolExecutor(max_workers=2)
+
+# Capture filenames: process start epoch + per-process sequence
+# (unique even for several captures within the same second)
+_START = int(time.time())
+_SEQ = itertools.count()
+
+
+def _capture_id():
+    return f"{_START}_{next(_SEQ):05d}"
+
 def ensure_results_dir():
-    ensure_dir(absolute_path("results"))
+    # makedirs creates "results" as a parent; prompt_cache is
+    # already ensured by core.tts on import
     ensure_dir(absolute_path("results", "reading_outputs"))
-    ensure_dir(absolute_path("results", "prompt_cache"))
 
 
 # ================================================================
 # IMAGE OPTIMIZATION
 # ================================================================
-def optimize_image(image_path):
+# Long side sent to Gemini; OCR accuracy plateaus above this
+OCR_MAX_SIDE = 1800
+
+
+def _jpeg_long_side(image_path):
+    """
+    Long side in pixels if the file is a JPEG, else None.
+    Reads the header only; no pixel decode.
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(image_path) as im:
+            if im.format != "JPEG":
+                return None
+            return max(im.size)
+    except Exception:
+        return None
+
+
+def _jpeg_reduce_flag(longest, max_side):
+    """
+    Pick a cv2.IMREAD_REDUCED_* flag so libjpeg-turbo decodes a large
+    JPEG directly at 1/2, 1/4 or 1/8 scale (DCT-scaled IDCT) while
+    keeping the long side >= max_side. Non-JPEGs (longest None)
+    decode at full size.
+    """
+    import cv2
+
+    if longest is None:
+        return cv2.IMREAD_COLOR
+
+    for factor, flag in (
+        (8, cv2.IMREAD_REDUCED_COLOR_8),
+        (4, cv2.IMREAD_REDUCED_COLOR_4),
+        (2, cv2.IMREAD_REDUCED_COLOR_2),
+    ):
+        if longest // factor >= max_side:
+            return flag
+
+    return cv2.IMREAD_COLOR
+
+
+def optimize_image(image_path, max_side=OCR_MAX_SIDE, quality=80):
     """
     Resize + compress image for faster Gemini processing.
+    Uses libjpeg-turbo scaled decode, OpenCV's SIMD resize (INTER_AREA)
+    and libjpeg-turbo encoder.
+    A JPEG that already fits max_side is sent as-is: no decode and
+    no lossy re-encode.
+    Returns JPEG bytes, or None if the image cannot be read.
     """
-    img = Image.open(image_path)
+    longest = _jpeg_long_side(image_path)
+    if longest is not None and longest <= max_side:
+        with open(image_path, "rb") as f:
+            return f.read()
 
-    if img.mode == "RGBA":
-        img = img.convert("RGB")
+    import cv2
 
-    img.thumbnail((1800, 1800))
+    flag = _jpeg_reduce_flag(longest, max_side)
+    img = cv2.imread(image_path, flag)    # BGR, no alpha channel
+    if img is None:
+        return None
 
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=80)
+    h, w = img.shape[:2]
+    scale = min(1.0, max_side / max(h, w))
+    if scale < 1.0:
+        img = cv2.resize(
+            img,
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        return None
 
-    return buf.getvalue()
+    return buf.tobytes()
 
 
 # ================================================================
 # GEMINI OCR
 # ================================================================
-def gemini_read(image_path, prompt):
+def gemini_read_stream(image_path, prompt):
     """
-    Run Gemini OCR + prompt on the image.
+    Run Gemini OCR + prompt on the image, yielding text chunks
+    as soon as Gemini emits them (stream=True).
+    Logs total length and duration when the stream ends.
     """
     if not GEMINI_API_KEY or not GEMINI_MODEL:
-        return "Gemini not configured.", 0
+        yield "Gemini not configured."
+        return
 
     optimized_bytes = optimize_image(image_path)
-    model = genai.GenerativeModel(GEMINI_MODEL)
+    if optimized_bytes is None:
+        log("READING", image_path, "Image load failed")
+        return
+
+    model = get_gemini_model(GEMINI_API_KEY, GEMINI_MODEL)
 
     final_text = []
     start = time.time()
 
-    response = model.generate_content(
-        [
-            {"mime_type": "image/jpeg", "data": optimized_bytes},
-            prompt,
-        ]
-    )
+    try:
+        response = model.generate_content(
+            [
+                {"mime_type": "image/jpeg", "data": optimized_bytes},
+                prompt,
+            ],
+            stream=True,
+        )
+
+        for chunk in response:
+            try:
+                piece = chunk.text
+            except ValueError:
+                # Chunk without text parts (e.g. safety metadata)
+                continue
+
+            final_text.append(piece)
+            yield piece
+
+    except Exception as e:
+        log("READING", image_path, f"Gemini error: {e}")
 
-    text = getattr(response, "text", "")
-    duration = round(time.time() - start, 2)
-    return text, duration
+    finally:
+        text = "".join(final_text)
+        duration = round(time.time() - start, 2)
+        log("READING", image_path, f"{len(text)} chars", duration)
+
+        print("\n===== OCR RESULT =====\n")
+        print(text)
+        print("\n=======================\n")
+
+
+def gemini_sentence_queue(image_path, prompt):
+    """
+    Start streaming OCR on a background thread.
+    Returns a Queue that receives each sentence as it completes,
+    followed by None when the stream ends.
+    """
+    sentence_q = queue.Queue()
+
+    def _produce():
+        try:
+            for sentence in stream_sentences(gemini_read_stream(image_path, prompt)):
+                sentence_q.put(sentence)
+        finally:
+            sentence_q.put(None)
+
+    threading.Thread(target=_produce, daemon=True).start()
+    return sentence_q
 
 
 # ================================================================
 # FILE PICKER
 # ================================================================
 def choose_file():
-    root = tk.Tk()
-    root.attributes("-topmost", True)
-    root.withdraw()
+    from tkinter import filedialog
 
     fp = filedialog.askopenfilename(
+        parent=get_tk_root(),
         title="Select an image file",
         filetypes=[
             ("Image Files", "*.jpg *.jpeg *.png *.bmp *.webp"),
             ("All Files", "*.*"),
         ],
     )
-    root.destroy()
 
     if not fp:
         return None
 
-    # Save copy to results
-    img = cv2.imread(fp)
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    save_path = absolute_path("results", "reading_outputs", f"capture_{ts}.jpg")
-    cv2.imwrite(save_path, img)
+    # Save copy to results (byte copy: no decode/re-encode, original quality)
+    ts = _capture_id()
+    ext = os.path.splitext(fp)[1] or ".jpg"
+    save_path = absolute_path("results", "reading_outputs", f"capture_{ts}{ext}")
+    shutil.copyfile(fp, save_path)
 
     return save_path
 
@@ -129,10 +311,52 @@ def choose_file():
 # ================================================================
 # CAMERA CAPTURE - Raspberry Pi compatible
 # ================================================================
+_picam = None
+_picam_failed = False    # init failed once: don't reopen the device per capture
+
+
+def _get_picam():
+    """
+    Start the in-process libcamera pipeline once and reuse it.
+    Returns None if picamera2 is unavailable or fails to start; a
+    failed start closes the device so the libcamera-still fallback
+    can open it.
+    """
+    global _picam, _picam_failed
+    if _picam is None and not _picam_failed and Picamera2 is not None:
+        cam = None
+        try:
+            cam = Picamera2()
+            # "RGB888" arrays are B,G,R ordered — what OpenCV expects
+            cam.configure(cam.create_still_configuration(main={"format": "RGB888"}))
+            cam.start()
+            _picam = cam
+            atexit.register(cam.close)
+        except Exception as e:
+            log("READING", "-", f"picamera2 init failed: {e}")
+            _picam_failed = True
+            if cam is not None:
+                try:
+                    cam.close()
+                except Exception:
+                    pass
+    return _picam
+
+
 def capture_with_libcamera():
-    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Fast path: in-process capture (no fork/exec + pipeline init).
+    # The frame stays in memory until it is written once, pre-scaled.
+    picam = _get_picam()
+    if picam is not None:
+        try:
+            return _save_frame(picam.capture_array())
+        except Exception as e:
+            log("READING", "-", f"picamera2 capture failed: {e}")
+
+    ts = _capture_id()
     out_path = absolute_path("results", "reading_outputs", f"capture_{ts}.jpg")
 
+    # Fallback: one-shot libcamera-still subprocess
     cmd = ["libcamera-still", "-o", out_path, "--immediate", "--timeout", "1"]
 
     try:
@@ -142,104 +366,277 @@ def capture_with_libcamera():
         return None
 
 
-def capture_image():
-    # Try OpenCV camera first (legacy mode)
-    cam = cv2.VideoCapture(0)
+def _save_frame(frame):
+    """
+    Write a camera frame already scaled to OCR_MAX_SIDE, so
+    optimize_image() can send the file as-is instead of decoding,
+    resizing and re-encoding it again.
+    Returns the saved path.
+    """
+    import cv2
 
-    if cam.isOpened():
-        prompt_path = speak("Press SPACE to capture, ESC to exit.")
-        if prompt_path:
-            tts_main.play(prompt_path)
+    h, w = frame.shape[:2]
+    scale = min(1.0, OCR_MAX_SIDE / max(h, w))
+    if scale < 1.0:
+        frame = cv2.resize(
+            frame,
+            (int(w * scale), int(h * scale)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    ts = _capture_id()
+    path = absolute_path("results", "reading_outputs", f"capture_{ts}.jpg")
+    cv2.imwrite(path, frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    return path
+
+
+def _capture_headless(cam):
+    """
+    No preview window: spoken countdown, then a single frame.
+    Returns the saved path or None.
+    """
+    if camera_countdown_p:
+        tts_main.play(camera_countdown_p)
+
+    # Warm-up: let auto-exposure settle before the real frame. Keep
+    # grabbing (not decoding) while the countdown plays so the
+    # buffered frame is fresh.
+    for _ in range(5):
+        cam.grab()
+    while tts_main.is_playing():
+        cam.grab()
+
+    frame = None
+    for _ in range(5):
+        ret, frame = cam.read()
+        if ret:
+            break
+
+    if frame is None:
+        return None
+
+    return _save_frame(frame)
+
+
+class _FrameReader:
+    """
+    Reads camera frames on a background thread and keeps only the
+    newest one, so the preview loop never blocks on cam.read().
+    """
+
+    def __init__(self, cam):
+        self._cam = cam
+        self._frame = None
+        self._lock = threading.Lock()
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while self._running:
+            ret, frame = self._cam.read()
+            if ret:
+                with self._lock:
+                    self._frame = frame
 
+    def latest(self):
+        with self._lock:
+            return self._frame
+
+    def stop(self):
+        # Must finish before cam.release()
+        self._running = False
+        self._thread.join(timeout=1.0)
+
+
+def _capture_preview(cam):
+    """
+    Preview window throttled to ~5 FPS; SPACE captures, ESC cancels.
+    Frames are read on a _FrameReader thread; this loop only shows
+    the newest frame and waits for keys.
+    Returns the saved path or None.
+    """
+    import cv2
+
+    if camera_capture_p:
+        tts_main.play(camera_capture_p)
+
+    reader = _FrameReader(cam)
+    path = None
+    try:
         while True:
-            ret, frame = cam.read()
-            if not ret:
+            frame = reader.latest()
+            if frame is None:
+                # Camera not delivering yet
+                time.sleep(0.05)
                 continue
 
             cv2.imshow("Camera Capture - Press SPACE", frame)
-            key = cv2.waitKey(1)
+            key = cv2.waitKey(200)
 
             if key == 32:  # SPACE
-                ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                path = absolute_path("results", "reading_outputs", f"capture_{ts}.jpg")
-                cv2.imwrite(path, frame)
-                cam.release()
-                cv2.destroyAllWindows()
-                return path
+                # Newest frame at the moment of the keypress
+                path = _save_frame(reader.latest())
+                break
 
             elif key == 27:  # ESC
                 break
-
-        cam.release()
+    finally:
+        # Even if _save_frame() raised: reader first, then the window
+        reader.stop()
         cv2.destroyAllWindows()
 
+    return path
+
+
+def capture_image():
+    import cv2
+
+    # Try OpenCV camera first (legacy mode)
+    cam = cv2.VideoCapture(0)
+
+    if cam.isOpened():
+        path = None
+        try:
+            path = _capture_preview(cam) if SHOW_PREVIEW else _capture_headless(cam)
+        except Exception as e:
+            log("READING", "-", f"OpenCV capture failed: {e}")
+        finally:
+            # Released before any fallback needs the device
+            cam.release()
+
+        if path:
+            return path
+
     # If OpenCV fails → fallback to libcamera
-    prompt_path = speak("Switching to Raspberry Pi camera mode.")
-    if prompt_path:
-        tts_main.play(prompt_path)
+    if camera_libcamera_p:
+        tts_main.play(camera_libcamera_p)
 
     return capture_with_libcamera()
 
 
+# ================================================================
+# WARM-UP (runs while the file picker is open)
+# ================================================================
+def _warmup():
+    """
+    Turn the user's file-picker time into warm-up:
+    audio device, TTS channel/credentials, cv2 import and
+    the Gemini client connection.
+    """
+    warm_up_output()
+
+    try:
+        speak("Ready.")
+    except Exception as e:
+        log("READING", "-", f"TTS warm-up failed: {e}")
+
+    try:
+        import cv2    # noqa: F401  (used by optimize_image)
+
+        if GEMINI_API_KEY and GEMINI_MODEL:
+            # count_tokens is free and goes over the same client
+            # channel as generate_content
+            get_gemini_model(GEMINI_API_KEY, GEMINI_MODEL).count_tokens("ping")
+    except Exception as e:
+        log("READING", "-", f"Gemini warm-up failed: {e}")
+
+
+# ================================================================
+# SUMMARY
+# ================================================================
+def summarize_to_audio(text):
+    """
+    Summarize text and synthesize the summary.
+    Returns (summary_text, audio path).
+    """
+    summary_text = summarize(text)
+    return summary_text, speak_cached_sentence(summary_text)
+
+
+def _summary_flow(read_so_far, back_prompt):
+    """
+    Shared pause-menu / voice-menu summary:
+    announce → play summary ('s' stops it) → play back_prompt.
+    """
+    if not read_so_far:
+        announce(no_content_yet_p)
+        return
+
+    # Summarize + synthesize while the prompt plays
+    summary_future = tts_pool.submit(summarize_to_audio, read_so_far.text())
+
+    announce(generating_summary_p)
+
+    summary_text, summary_audio = summary_future.result()
+
+    print("\n========SUMMARY=======\n")
+    print(summary_text)
+
+    _reset_audio()
+
+    tts_summary.play(summary_audio)
+
+    print("Summary mode — press 's' to stop")
+
+    _summary_playing = tts_summary.is_playing
+    _get_key = get_key
+
+    while True:
+        if not _summary_playing():
+            break
+
+        if _get_key(0.25) == "s":
+            announce(stopping_summary_p)
+            break
+
+    # Back to the calling menu
+    announce(back_prompt)
+
+
 # ================================================================
 # MAIN
 # ================================================================
 def main():
     ensure_results_dir()
     reading_complete = False
+
+    # Bind names used by the playback monitor loop to locals
+    # (avoids global + attribute lookups on every tick)
+    _main_playing = tts_main.is_playing
+    _get_key = get_key
+
+    # Playback end wakes any pending get_key(timeout), so the monitor
+    # loops react to "sentence finished" without polling
+    tts_main.on_done = wake
+    tts_summary.on_done = wake
+
     # ---------------------------------------------------------
     # INTRO PROMPT
     # ---------------------------------------------------------
-    tts_main.stop()
-    tts_summary.stop()
-    time.sleep(1.0)
-
-    tts_main.play(select_file_p)
-    while tts_main.is_playing():
-        time.sleep(0.05)
-
-    time.sleep(1.0)  # let ALSA settle before Tk
+    announce(select_file_p)
 
     # ---------------------------------------------------------
     # STEP 1 — Select file
     # ---------------------------------------------------------
+    # Warm up downstream services while the user is in the picker
+    threading.Thread(target=_warmup, daemon=True).start()
+
     img_path = choose_file()
 
     if not img_path:
         # Non-critical info
-        tts_main.stop()
-        tts_summary.stop()
-        time.sleep(1.0)
-
-        tts_main.play(no_file_p)
-        while tts_main.is_playing():
-            time.sleep(0.05)
+        announce(no_file_p)
 
-        time.sleep(1.0)
         img_path = capture_image()
 
     if not img_path:
-        tts_main.stop()
-        tts_summary.stop()
-        time.sleep(1.0)
-
-        tts_main.play(no_image_exit_p)
-        while tts_main.is_playing():
-            time.sleep(0.05)
+        announce(no_image_exit_p)
         return
 
     # ---------------------------------------------------------
     # OCR PROMPT
     # ---------------------------------------------------------
-    tts_main.stop()
-    tts_summary.stop()
-    time.sleep(1.0)
-
-    tts_main.play(processing_p)
-    while tts_main.is_playing():
-        time.sleep(0.05)
-    time.sleep(1.0)
-
     refinement_prompt = """
     This image was captured by a blind user.
     Extract the exact text from the book page.
@@ -247,79 +644,119 @@ def main():
     Do not add asterisks or other formatting.
     """
 
-    text, duration = gemini_read(img_path, refinement_prompt)
-    log("READING", img_path, f"{len(text)} chars", duration)
+    # OCR runs on a producer thread; sentences arrive as they complete,
+    # so reading starts before OCR of the whole page has finished.
+    # Started before the "processing" prompt so the two overlap.
+    sentence_q = gemini_sentence_queue(img_path, refinement_prompt)
 
-    print("\n===== OCR RESULT =====\n")
-    print(text)
-    print("\n=======================\n")
+    announce(processing_p)
 
-    if not text.strip():
-        tts_main.stop()
-        tts_summary.stop()
-        time.sleep(1.0)
-
-        tts_main.play(empty_page_p)
-        while tts_main.is_playing():
-            time.sleep(0.05)
+    first_sentence = sentence_q.get()
+    if first_sentence is None:
+        announce(empty_page_p)
         return
 
-    # ---------------------------------------------------------
-    # CHUNKING
-    # ---------------------------------------------------------
-    sentences = split_into_sentences(text)
-    if not sentences:
-        tts_main.stop()
-        tts_summary.stop()
-        time.sleep(1.0)
-
-        tts_main.play(no_sentences_p)
-        while tts_main.is_playing():
-            time.sleep(0.05)
-        return
-
-    read_so_far = []
+    sentences = [first_sentence]
+    read_so_far = RollingContext()    # bounded input for summaries
+    read_sentences = []               # sentences read, saved on voice quit
     current_index = 0
 
+    # Speculative TTS: index → (Future[list of audio bytes], position,
+    # index of the batch's last sentence)
+    audio_futures = {}
+
+    stream_done = False
+
+    def _ensure_sentence(i, block=True):
+        """
+        Take sentences from the OCR queue until index i exists.
+        With block=False, only uses sentences that have already arrived.
+        """
+        nonlocal stream_done
+        while len(sentences) <= i:
+            if stream_done:
+                return False
+            try:
+                next_sentence = sentence_q.get(block=block)
+            except queue.Empty:
+                return False
+            if next_sentence is None:
+                stream_done = True
+                return False
+            sentences.append(next_sentence)
+        return True
+
+    def _prefetch(batch_end):
+        """
+        Keep one batch in flight ahead of playback: unless it is already
+        requested, submit TTS for the sentences after batch_end (the last
+        index of the batch now playing) that have already arrived, up to
+        BATCH_MAX_CHARS, as one batch request.
+        """
+        todo = []
+        size = 0
+        i = batch_end + 1
+        while i not in audio_futures and _ensure_sentence(i, block=False):
+            if todo and size + len(sentences[i]) > BATCH_MAX_CHARS:
+                break
+            todo.append(i)
+            size += len(sentences[i])
+            i += 1
+        if not todo:
+            return
+
+        batch = tts_pool.submit(_speak_bytes_batch, [sentences[i] for i in todo])
+        for pos, i in enumerate(todo):
+            audio_futures[i] = (batch, pos, todo[-1])
+
     print("\n===== CHUNKED READING (PAUSE + SUMMARY + VOICE MODE) =====\n")
 
     # ---------------------------------------------------------
     # CHUNK LOOP
     # ---------------------------------------------------------
-    while current_index < len(sentences):
+    while _ensure_sentence(current_index):
         sentence = sentences[current_index]
-        print(f"[READ] {current_index + 1}/{len(sentences)} → {sentence}")
+        print(f"[READ] {current_index + 1} → {sentence}")
 
-        sentence_audio = speak(sentence)
+        pending = audio_futures.pop(current_index, None)
+        if pending:
+            batch, pos, batch_end = pending
+            sentence_audio = batch.result()[pos]
+        else:
+            batch_end = current_index
+            sentence_audio = speak_cached_sentence(sentence)
 
-        tts_main.stop()
-        tts_summary.stop()
+        _reset_audio()
         # time.sleep(1.0)
 
         tts_main.play(sentence_audio)
 
+        # Synthesize the next batch while this one plays
+        _prefetch(batch_end)
+
         # -----------------------------
         # PLAYBACK MONITOR
         # -----------------------------
         while True:
-            if not tts_main.is_playing():
+            if not _main_playing():
                 break
-                
-            # Non-blocking keypress
-            if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                key = sys.stdin.readline().strip().lower()
+
+            # Wait for a keypress; playback end wakes this immediately,
+            # the timeout only paces prefetching of streamed sentences
+            key = _get_key(0.25)
+            if key is None:
+                # Sentences that streamed in since playback started
+                # get synthesized now rather than after this one ends
+                _prefetch(batch_end)
+
+            else:
 
                 # =====================================================
                 # (p) — PAUSE
                 # =====================================================
                 if key == "p":
-                    tts_main.play(pause_beep)
-                    tts_main.stop()
-                    tts_summary.stop()
-                    # time.sleep(1.0)
+                    announce(pause_beep, timeout=0.3)
 
-                    time.sleep(0.3)
-                    
                     # ----- PAUSE MENU -----
                     while True:
                         print("\nPaused. Options:")
@@ -328,81 +765,19 @@ def main():
                         print("  q = quit reading module")
                         sys.stdout.flush()
 
-                        choice = sys.stdin.readline().strip().lower()
+                        choice = _get_key()
 
                         # RESUME → restart sentence from start
                         if choice == "p":
-                            tts_main.play(resume_beep)
-                            tts_main.stop()
-                            tts_summary.stop()
-                            # time.sleep(1.0)
-
-                            time.sleep(0.3)
+                            announce(resume_beep, timeout=0.3)
 
-                            sentence_audio = speak(sentence)
+                            # Replay the already-synthesized sentence
                             tts_main.play(sentence_audio)
                             break
 
                         # SUMMARY
                         elif choice == "m":
-                            if not read_so_far:
-                                tts_main.stop()
-                                tts_summary.stop()
-                                time.sleep(1.0)
-
-                                tts_main.play(no_content_yet_p)
-                                while tts_main.is_playing():
-                                    time.sleep(0.05)
-                                continue
-
-                            tts_main.stop()
-                            tts_summary.stop()
-                            time.sleep(1.0)
-
-                            tts_main.play(generating_summary_p)
-                            while tts_main.is_playing():
-                                time.sleep(0.05)
-                            time.sleep(1.0)
-
-                            summary_text = summarize(" ".join(read_so_far))
-                            summary_audio = speak(summary_text)
-
-                            print("\n========SUMMARY=======\n")
-                            print(summary_text)
-
-                            tts_main.stop()
-                            tts_summary.stop()
-                            time.sleep(1.0)
-
-                            tts_summary.play(summary_audio)
-
-                            print("Summary mode — press 's' to stop")
-
-                            while True:
-                                if not tts_summary.is_playing():
-                                    break
-
-                                if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                                    if sys.stdin.readline().strip().lower() == "s":
-                                        tts_main.stop()
-                                        tts_summary.stop()
-                                        time.sleep(1.0)
-
-                                        tts_main.play(stopping_summary_p)
-                                        while tts_main.is_playing():
-                                            time.sleep(0.05)
-                                        break
-
-                                time.sleep(0.05)
-
-                            # Back to pause menu
-                            tts_main.stop()
-                            tts_summary.stop()
-                            time.sleep(1.0)
-
-                            tts_main.play(back_pause_menu_p)
-                            while tts_main.is_playing():
-                                time.sleep(0.05)
+                            _summary_flow(read_so_far, back_pause_menu_p)
                             continue
 
                         # QUIT
@@ -415,13 +790,7 @@ def main():
                             with open(read_so_far_track_file, 'wb') as file_object:
                                 pickle.dump(current_index, file_object)
                                 
-                            tts_main.stop()
-                            tts_summary.stop()
-                            time.sleep(1.0)
-
-                            tts_main.play(exiting_module_p)
-                            while tts_main.is_playing():
-                                time.sleep(0.05)
+                            announce(exiting_module_p)
                             return
 
                         else:
@@ -433,13 +802,7 @@ def main():
                 elif key == "v":
                     from core.stt_commands import listen_for_command
 
-                    tts_main.stop()
-                    tts_summary.stop()
-                    time.sleep(1.0)
-
-                    tts_main.play(vc_intro_p)
-                    while tts_main.is_playing(): time.sleep(0.05)
-                    time.sleep(1.0)
+                    announce(vc_intro_p)
 
                     command = listen_for_command()
 
@@ -448,14 +811,9 @@ def main():
 
                     # RESUME
                     if command == "resume":
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
+                        announce(resume_beep, timeout=0.3)
 
-                        tts_main.play(resume_beep)
-                        time.sleep(0.3)
-
-                        sentence_audio = speak(sentence)
+                        # Replay the already-synthesized sentence
                         tts_main.play(sentence_audio)
                         break
 
@@ -467,100 +825,27 @@ def main():
                         with open(reading_complete_track_file, 'wb') as file_object:
                             pickle.dump(reading_complete, file_object)
                         with open(read_so_far_track_file, 'wb') as file_object:
-                            pickle.dump(read_so_far, file_object)
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
-
-                        tts_main.play(exiting_module_p)
-                        while tts_main.is_playing(): time.sleep(0.05)
+                            pickle.dump(read_sentences, file_object)
+                        announce(exiting_module_p)
                         return
 
                     # SUMMARY
                     elif command == "summary":
-                        if not read_so_far:
-                            tts_main.stop()
-                            tts_summary.stop()
-                            time.sleep(1.0)
-
-                            tts_main.play(no_content_yet_p)
-                            while tts_main.is_playing(): time.sleep(0.05)
-                            continue
-
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
-
-                        tts_main.play(generating_summary_p)
-                        while tts_main.is_playing(): time.sleep(0.05)
-                        time.sleep(1.0)
-
-                        summary_text = summarize(" ".join(read_so_far))
-                        summary_audio = speak(summary_text)
-
-                        print("\n========SUMMARY=======\n")
-                        print(summary_text)
-
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
-
-                        tts_summary.play(summary_audio)
-
-                        print("Summary mode — press 's' to stop")
-
-                        while True:
-                            if not tts_summary.is_playing():
-                                break
-
-                            if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-                                if sys.stdin.readline().strip().lower() == "s":
-                                    tts_main.stop()
-                                    tts_summary.stop()
-                                    time.sleep(1.0)
-
-                                    tts_main.play(stopping_summary_p)
-                                    while tts_main.is_playing(): time.sleep(0.05)
-                                    break
-
-                            time.sleep(0.05)
-
-                        # Back to voice control
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
-
-                        tts_main.play(vc_back_p)
-                        while tts_main.is_playing(): time.sleep(0.05)
-                        time.sleep(1.0)
+                        _summary_flow(read_so_far, vc_back_p)
                         continue
 
                     else:
-                        tts_main.stop()
-                        tts_summary.stop()
-                        time.sleep(1.0)
-
-                        tts_main.play(vc_unknown_p)
-                        while tts_main.is_playing(): time.sleep(0.05)
-                        time.sleep(1.0)
-
+                        announce(vc_unknown_p)
 
                     # Too many failures → auto-return to reading
-                    tts_main.stop()
-                    tts_summary.stop()
-                    time.sleep(1.0)
-
-                    tts_main.play(return_to_reading_p)
-                    while tts_main.is_playing(): time.sleep(0.05)
-                    time.sleep(1.0)
+                    announce(return_to_reading_p)
 
-                    sentence_audio = speak(sentence)
+                    # Replay the already-synthesized sentence
                     tts_main.play(sentence_audio)
 
-                time.sleep(0.05)
-
         # Finished this sentence
-        read_so_far.append(sentence)
+        read_so_far.add(sentence)
+        read_sentences.append(sentence)
         current_index += 1
 
     # ---------------------------------------------------------
@@ -571,13 +856,7 @@ def main():
         if os.path.exists(read_so_far_track_file):
             os.remove(read_so_far_track_file)
     
-    tts_main.stop()
-    tts_summary.stop()
-    time.sleep(1.0)
-
-    tts_main.play(all_done_p)
-    while tts_main.is_playing():
-        time.sleep(0.05)
+    announce(all_done_p)
 
     print("\n===== COMPLETED ALL SENTENCES =====\n")
 # ================================================================
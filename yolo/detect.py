@@ -1,6 +1,10 @@
 import datetime
 import sys
 import os
+import json
+import hashlib
+import mimetypes
+from collections import Counter
 
 # Ensure project root in sys.path
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -8,17 +12,19 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 import time
+import queue
 import threading
+from concurrent.futures import Future
 import cv2
-import tkinter as tk
-from tkinter import filedialog
+import numpy as np
 from dotenv import load_dotenv
-import google.generativeai as genai
+import torch
 from ultralytics import YOLO
 
-from core.tts import speak
+from core.tts import speak_bytes
+from core.tts_player import tts_main
 from core.logger import log
-from core.utils import absolute_path, ensure_dir, load_credential_path
+from core.utils import absolute_path, ensure_dir, load_credential_path, get_tk_root, get_gemini_model
 
 load_dotenv()
 
@@ -30,8 +36,8 @@ CRED_PATH = load_credential_path("yolo", "yolo-key.json")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL")
 
-if GEMINI_API_KEY:
-    genai.configure(api_key=GEMINI_API_KEY)
+# One model handle for the whole session (None if not configured)
+_GEMINI = get_gemini_model(GEMINI_API_KEY, GEMINI_MODEL) if GEMINI_API_KEY and GEMINI_MODEL else None
 
 # ================================================================
 # DIRECTORIES
@@ -39,37 +45,289 @@ if GEMINI_API_KEY:
 OUTPUT_DIR = absolute_path("results", "yolo_outputs")
 ensure_dir(OUTPUT_DIR)
 
+# ================================================================
+# SPEECH (background worker)
+# - say() only enqueues; one worker thread synthesizes (cached Opus)
+#   and plays each message in order, from memory
+# - The cv2 UI loop never blocks on TTS network calls or playback
+# ================================================================
+_say_q = queue.Queue()
+
+# Bumped by end_speech(); messages queued before that are skipped
+_say_gen = 0
+_say_lock = threading.Lock()
+_say_closed = False    # set by end_speech(): later say() calls are dropped
+
+
+def _say_worker():
+    while True:
+        gen, message = _say_q.get()
+        try:
+            if gen != _say_gen:
+                continue
+            # Played from memory: no temp file written and read back
+            audio = speak_bytes(message)
+            with _say_lock:
+                if not audio or gen != _say_gen:
+                    continue
+                tts_main.play(audio)
+            tts_main.wait_done()
+        except Exception as e:
+            log("YOLO", "-", f"Speech error: {e}")
+        finally:
+            _say_q.task_done()
+
+
+def say(message):
+    """Queue a message to be spoken; returns immediately."""
+    if not _say_closed:
+        _say_q.put((_say_gen, message))
+
+
+def end_speech(final_message):
+    """
+    Discard every queued message, stop the one playing and queue
+    final_message as the last thing said (e.g. on quit, so a long
+    Gemini summary does not hold up the exit).
+    """
+    global _say_gen, _say_closed
+    with _say_lock:
+        _say_gen += 1
+        _say_closed = True
+        tts_main.stop()
+    while True:
+        try:
+            _say_q.get_nowait()
+        except queue.Empty:
+            break
+        _say_q.task_done()
+    _say_q.put((_say_gen, final_message))
+
+
+def flush_speech():
+    """Block until every queued message has been spoken."""
+    _say_q.join()
+
+
+threading.Thread(target=_say_worker, daemon=True).start()
+
 # ================================================================
 # YOLO MODEL
+# - On CPU hosts, exported once next to the weights (ONNX by default);
+#   later runs load the export directly instead of the eager PyTorch
+#   checkpoint. CUDA hosts keep the checkpoint (onnxruntime is CPU-only)
+# - Any export/load/run failure falls back to the checkpoint
+# - YOLO_EXPORT=engine for TensorRT FP16 on a CUDA box, ncnn/openvino
+#   for other CPU runtimes, "pt" to keep the PyTorch checkpoint
 # ================================================================
-model = YOLO("yolov8n.pt")
+YOLO_WEIGHTS = "yolov8n.pt"
+YOLO_EXPORT = os.getenv("YOLO_EXPORT", "pt" if torch.cuda.is_available() else "onnx")
+
+# Inference size: 416 is plenty for narration and ~2.3x fewer FLOPs
+# than 640; YOLO_IMGSZ=640 for maximum accuracy
+YOLO_IMGSZ = int(os.getenv("YOLO_IMGSZ", "416"))
+
+# FP16 activations only where a GPU can use them
+YOLO_HALF = torch.cuda.is_available()
+
+# Images per forward pass when several files are processed together
+YOLO_BATCH = 16
+
+# Formats exported with a dynamic batch axis (ncnn has a fixed batch of 1)
+_DYNAMIC_FORMATS = {"onnx", "openvino", "engine"}
+
+# Export format → suffix ultralytics gives the exported file/dir
+_EXPORT_SUFFIX = {
+    "onnx": ".onnx",
+    "engine": ".engine",
+    "openvino": "_openvino_model",
+    "ncnn": "_ncnn_model",
+}
+
+
+def _load_exported():
+    """
+    Export (once), load and test-run the exported model.
+    Returns (model, max batch), or None if exporting is off or any
+    step fails. If the export itself is rejected (e.g. an unsupported
+    op), <export>.failed is left next to the weights so later runs go
+    straight to the checkpoint (delete the marker to retry). I/O, memory
+    and missing-package errors, and load/run failures, are retried on
+    the next run.
+    """
+    if YOLO_EXPORT not in _EXPORT_SUFFIX:
+        return None
+
+    dynamic = YOLO_EXPORT in _DYNAMIC_FORMATS
+
+    # Exports have a fixed input size (and maybe batch): both in the name
+    base = os.path.splitext(YOLO_WEIGHTS)[0]
+    tag = "_dyn" if dynamic else ""
+    exported = f"{base}_{YOLO_IMGSZ}{tag}{_EXPORT_SUFFIX[YOLO_EXPORT]}"
+    failed_marker = exported + ".failed"
+
+    if os.path.exists(failed_marker):
+        return None
+
+    if not os.path.exists(exported):
+        try:
+            path = YOLO(YOLO_WEIGHTS).export(
+                format=YOLO_EXPORT,
+                imgsz=YOLO_IMGSZ,
+                half=YOLO_EXPORT == "engine",    # FP16 needs a GPU
+                dynamic=dynamic,
+                batch=YOLO_BATCH if dynamic else 1,    # max batch for engine
+            )
+            # Atomic: an interrupted export never leaves a partial file here
+            os.replace(path, exported)
+
+        except (OSError, MemoryError, ImportError) as e:
+            # Disk full, interrupted, missing runtime: may work next time
+            log("YOLO", exported, f"Export failed, retrying next run; using {YOLO_WEIGHTS}: {e!r}")
+            return None
+
+        except Exception as e:
+            # The exporter rejected the model: same result every run
+            log("YOLO", exported, f"Export failed, marking {failed_marker}; using {YOLO_WEIGHTS}: {e!r}")
+            try:
+                with open(failed_marker, "w", encoding="utf-8") as f:
+                    f.write(repr(e))
+            except OSError:
+                pass
+            return None
+
+    try:
+        exported_model = YOLO(exported, task="detect")
+
+        # Proves the runtime can execute it; doubles as the warm-up
+        _predict_with(exported_model, _DUMMY_FRAME)
+        return exported_model, (YOLO_BATCH if dynamic else 1)
+
+    except Exception as e:
+        log("YOLO", exported, f"Exported model unusable, using {YOLO_WEIGHTS}: {e!r}")
+        return None
+
+
+def load_model():
+    """
+    Exported model if it works, else the PyTorch checkpoint.
+    Either way one inference has run, so the first real predict()
+    does not pay runtime init / weight upload / kernel selection.
+    Returns (model, max images per predict call).
+    """
+    exported = _load_exported()
+    if exported is not None:
+        return exported
+
+    checkpoint = YOLO(YOLO_WEIGHTS)
+    try:
+        _predict_with(checkpoint, _DUMMY_FRAME)
+    except Exception as e:
+        log("YOLO", "-", f"Warm-up failed: {e}")
+    return checkpoint, YOLO_BATCH
+
+
+_DUMMY_FRAME = np.zeros((YOLO_IMGSZ, YOLO_IMGSZ, 3), dtype=np.uint8)
+
+# Set by _init_model() on the detect worker
+model = None
+_max_batch = 1
+
+
+def _predict_with(yolo_model, source):
+    return yolo_model.predict(source, verbose=False, imgsz=YOLO_IMGSZ, half=YOLO_HALF)
+
+
+def predict(source):
+    """
+    source: one image, or a list of images. ultralytics stacks an
+    in-memory list into a single forward pass, so lists are split
+    here into groups the loaded model accepts.
+    """
+    if not isinstance(source, list):
+        return _predict_with(model, source)
+
+    results = []
+    for i in range(0, len(source), _max_batch):
+        results.extend(_predict_with(model, source[i:i + _max_batch]))
+    return results
+
+
+def _init_model():
+    global model, _max_batch
+    model, _max_batch = load_model()
+
+
+# Single worker: every predict() runs here, one at a time (the
+# predictor is not thread-safe). Loading + warm-up run first, while
+# the file picker is open; later predict() calls queue behind it.
+# A daemon thread (not a ThreadPoolExecutor, whose workers are joined
+# at exit), so Q never waits for a first-run export or a long predict.
+_detect_q = queue.Queue()
+
+
+def _detect_worker():
+    while True:
+        future, fn, args = _detect_q.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+
+def _submit_detect(fn, *args):
+    """Run fn(*args) on the detect worker; returns a Future."""
+    future = Future()
+    _detect_q.put((future, fn, args))
+    return future
+
+
+def _cancel_detect():
+    """Cancel detection jobs that have not started yet."""
+    while True:
+        try:
+            future, _, _ = _detect_q.get_nowait()
+        except queue.Empty:
+            break
+        future.cancel()
+
+
+threading.Thread(target=_detect_worker, daemon=True).start()
+_submit_detect(_init_model)
 
 # ================================================================
 # FILE PICKER
 # ================================================================
-def choose_file():
-    root = tk.Tk()
-    root.attributes("-topmost", True)
-    root.withdraw()
-
-    fp = filedialog.askopenfilename(
-        title="Select an image",
+def choose_files():
+    """
+    Image paths from argv, else $YOLO_IMAGE (os.pathsep-separated),
+    else a Tk multi-select dialog (Tk only starts when neither is given).
+    Returns a list (empty if nothing was chosen).
+    """
+    for candidates in (sys.argv[1:], os.getenv("YOLO_IMAGE", "").split(os.pathsep)):
+        paths = [p for p in candidates if p and os.path.isfile(p)]
+        if paths:
+            return paths
+
+    from tkinter import filedialog
+
+    fps = filedialog.askopenfilenames(
+        parent=get_tk_root(),
+        title="Select one or more images",
         filetypes=[("Images", "*.jpg *.jpeg *.png *.bmp"), ("All Files", "*.*")]
     )
-    root.destroy()
-    return fp
+    return list(fps)
 
 # ================================================================
 # YOLO COUNTS
 # ================================================================
 def describe_yolo(classes, names):
-    if not classes:
+    if len(classes) == 0:
         return "I do not see any objects."
 
-    counts = {}
-    for cls_idx in classes:
-        label = names[int(cls_idx)]
-        counts[label] = counts.get(label, 0) + 1
+    counts = Counter(names[int(c)] for c in classes)
 
     parts = [f"{count} {label}{'' if count==1 else 's'}" for label, count in counts.items()]
     return "I can see " + ", ".join(parts) + "."
@@ -77,29 +335,21 @@ def describe_yolo(classes, names):
 # ================================================================
 # YOLO POSITIONAL DESCRIPTIONS
 # ================================================================
-def positional_descriptions(results):
-    if len(results[0].boxes) == 0:
+def positional_descriptions(cls, xyxy, names, width):
+    if len(cls) == 0:
         return "I do not see any objects."
 
-    boxes = results[0].boxes
-    names = results[0].names
-    width = results[0].orig_shape[1]
-
-    left_items, center_items, right_items = [], [], []
+    # Integer pixel centers vs. integer thirds: no float math per box
+    left_thr = width // 3
+    right_thr = (2 * width) // 3
+    x_center = (xyxy[:, 0] + xyxy[:, 2]).astype(np.int32) >> 1
+    left_mask = x_center < left_thr
+    right_mask = x_center > right_thr
+    center_mask = ~(left_mask | right_mask)
 
-    for box in boxes:
-        cls_idx = int(box.cls[0])
-        label = names[cls_idx]
-
-        xyxy = box.xyxy[0]
-        x_center = float((xyxy[0] + xyxy[2]) / 2)
-
-        if x_center < width * 0.33:
-            left_items.append(label)
-        elif x_center > width * 0.66:
-            right_items.append(label)
-        else:
-            center_items.append(label)
+    left_items = [names[c] for c in cls[left_mask]]
+    center_items = [names[c] for c in cls[center_mask]]
+    right_items = [names[c] for c in cls[right_mask]]
 
     parts = []
     if left_items:   parts.append("to the left I can see " + ", ".join(left_items))
@@ -108,35 +358,120 @@ def positional_descriptions(results):
 
     return ". ".join(parts) + "."
 
+# ================================================================
+# COMBINED DESCRIPTION (one pass over the boxes)
+# ================================================================
+def describe_all(results):
+    """
+    Returns (count description, positional description).
+    Box classes and coordinates are converted to NumPy once and
+    shared by both descriptions.
+    """
+    boxes = results[0].boxes
+    names = results[0].names
+    width = results[0].orig_shape[1]
+
+    cls = boxes.cls.cpu().numpy().astype(np.int32)
+    xyxy = boxes.xyxy.cpu().numpy()
+
+    return (
+        describe_yolo(cls, names),
+        positional_descriptions(cls, xyxy, names, width),
+    )
+
 # ================================================================
 # GEMINI SCENE DESCRIPTION
 # ================================================================
-def gemini_scene(path):
-    img = cv2.imread(path)
-    if img is None:
-        speak("Image load failed.")
+# Image MIME types Gemini takes directly
+GEMINI_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp", "image/heic", "image/heif"}
+
+GEMINI_CACHE_PATH = os.path.join(OUTPUT_DIR, "gemini_cache.json")
+_gemini_cache_lock = threading.Lock()
+
+
+def _load_gemini_cache():
+    try:
+        with open(GEMINI_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# {sha256 of image file: scene description}, persisted across runs
+_gemini_cache = _load_gemini_cache()
+
+
+def _store_gemini_cache(key, text):
+    with _gemini_cache_lock:
+        _gemini_cache[key] = text
+        tmp_path = GEMINI_CACHE_PATH + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(_gemini_cache, f)
+            os.replace(tmp_path, GEMINI_CACHE_PATH)
+        except OSError as e:
+            log("YOLO-GEMINI", GEMINI_CACHE_PATH, f"Cache write error: {e}")
+
+
+def gemini_scene(path, cached_bytes=None):
+    """
+    Describe the image with Gemini and speak it.
+    cached_bytes: the file's contents if the caller already read them
+    (skips re-reading the file on every G press).
+    """
+    if _GEMINI is None:
+        say("Gemini is not configured.")
         return
 
-    success, encoded = cv2.imencode(".jpg", img)
-    if not success:
-        speak("Image encoding failed.")
+    image_bytes = cached_bytes
+    if image_bytes is None:
+        try:
+            with open(path, "rb") as f:
+                image_bytes = f.read()
+        except OSError:
+            say("Image load failed.")
+            return
+
+    key = hashlib.sha256(image_bytes).hexdigest()
+
+    # Same image again → no upload, no Gemini round trip
+    if key in _gemini_cache:
+        say("Gemini summary: " + _gemini_cache[key])
+        log("YOLO-GEMINI", path, "Cache hit")
         return
 
-    image_bytes = encoded.tobytes()
-    model_g = genai.GenerativeModel(GEMINI_MODEL)
+    # Formats Gemini accepts are uploaded as-is (no decode/re-encode);
+    # anything else (e.g. BMP) is converted to JPEG first
+    mime_type = mimetypes.guess_type(path)[0]
+    if mime_type not in GEMINI_IMAGE_TYPES:
+        img = cv2.imread(path)
+        if img is None:
+            say("Image load failed.")
+            return
+
+        success, encoded = cv2.imencode(".jpg", img)
+        if not success:
+            say("Image encoding failed.")
+            return
+
+        image_bytes = encoded.tobytes()
+        mime_type = "image/jpeg"
 
     prompt = "Describe the scene in 40 words."
 
     t0 = time.time()
     try:
-        res = model_g.generate_content(
-            [{"mime_type": "image/jpeg", "data": image_bytes}, prompt]
+        res = _GEMINI.generate_content(
+            [{"mime_type": mime_type, "data": image_bytes}, prompt]
         )
 
         text = getattr(res, "text", "")
         duration = round(time.time() - t0, 2)
 
-        speak("Gemini summary: " + text)
+        if text:
+            _store_gemini_cache(key, text)
+
+        say("Gemini summary: " + text)
         log("YOLO-GEMINI", path, f"{len(text)} chars", duration)
 
     except Exception as e:
@@ -145,65 +480,154 @@ def gemini_scene(path):
 # ================================================================
 # MAIN
 # ================================================================
+DISPLAY_WIDTH = 900
+
+
+def _fit_display(frame):
+    """Downscale (INTER_AREA) to DISPLAY_WIDTH so imshow moves less data."""
+    h, w = frame.shape[:2]
+    if w <= DISPLAY_WIDTH:
+        return frame
+    scale = DISPLAY_WIDTH / w
+    return cv2.resize(frame, (DISPLAY_WIDTH, int(h * scale)), interpolation=cv2.INTER_AREA)
+
+
+def _detect(img):
+    """
+    Runs on the detect worker: predict, draw (display-sized) and
+    describe, so the UI thread only swaps in the finished frame.
+    Returns (annotated full-size frame, annotated display frame,
+    count description, positional description).
+    """
+    results = predict(img)
+    # plot() already returns BGR (drawn on the BGR input), ready for cv2
+    annotated = results[0].plot(line_width=2)
+    desc, pos_desc = describe_all(results)
+    return annotated, _fit_display(annotated), desc, pos_desc
+
+
+def describe_batch(paths):
+    """
+    Several images: batched predict() over all of them, then each
+    description is narrated and its annotated image saved.
+    """
+    loaded = [(p, cv2.imread(p)) for p in paths]
+    loaded = [(p, img) for p, img in loaded if img is not None]
+    if not loaded:
+        say("Failed to open images.")
+        return
+
+    t0 = time.time()
+    try:
+        results = _submit_detect(predict, [img for _, img in loaded]).result()
+    except Exception as e:
+        log("YOLO", "-", f"Batch detection failed: {e}")
+        say("Detection failed.")
+        return
+    duration = round(time.time() - t0, 2)
+    log("YOLO", "-", f"Batch of {len(loaded)} images", duration)
+
+    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    for i, ((fp, _), result) in enumerate(zip(loaded, results), 1):
+        desc, pos_desc = describe_all([result])
+        log("YOLO", fp, f"{desc} | {pos_desc}")
+
+        cv2.imwrite(os.path.join(OUTPUT_DIR, f"output_{ts}_{i}.jpg"), result.plot(line_width=2))
+        say(f"Image {i}. {desc} {pos_desc}")
+
+
 def main():
-    speak("Select an image for detection.")
-    fp = choose_file()
+    say("Select an image for detection.")
+    paths = choose_files()
+
+    if not paths:
+        say("No image selected.")
+        return
 
-    if not fp:
-        speak("No image selected.")
+    # Several files → batch throughput; one file → interactive, low latency
+    if len(paths) > 1:
+        describe_batch(paths)
         return
 
-    img = cv2.imread(fp)
+    fp = paths[0]
+
+    # Read the file once: decoded here for YOLO/display, and the same
+    # bytes go to Gemini on every G press
+    try:
+        with open(fp, "rb") as f:
+            raw_bytes = f.read()
+    except OSError:
+        raw_bytes = b""
+
+    img = cv2.imdecode(np.frombuffer(raw_bytes, dtype=np.uint8), cv2.IMREAD_COLOR) if raw_bytes else None
     if img is None:
-        speak("Failed to open image.")
+        say("Failed to open image.")
         return
 
     # Window sizing for Pi screen
     h, w, _ = img.shape
     cv2.namedWindow("YOLO", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("YOLO", 900, int(h * 900 / w))
+    cv2.resizeWindow("YOLO", DISPLAY_WIDTH, int(h * DISPLAY_WIDTH / w))
 
-    speak("Press Y for YOLO detection, G for Gemini summary, Q to exit.")
+    # Detect in the background while the instructions play, so
+    # pressing Y just reuses the result
+    results_future = _submit_detect(_detect, img)
 
-    display_frame = img
+    say("Press Y for YOLO detection, G for Gemini summary, Q to exit.")
+
+    # imshow() gets a display-sized copy; YOLO still sees the full image
+    display_frame = _fit_display(img)
+    dirty = True    # frame changed since the last imshow()
+    y_pending = False    # Y pressed, result not shown yet (repeats coalesce)
+    annotated = None     # full-size detection frame, saved on exit
 
     while True:
-        cv2.imshow("YOLO", display_frame)
-        key = cv2.waitKey(1) & 0xFF
+        # Only redraw when the frame changed; waitKey(30) keeps the
+        # window responsive (~33 Hz) without pegging a core
+        if dirty:
+            cv2.imshow("YOLO", display_frame)
+            dirty = False
+        key = cv2.waitKey(30) & 0xFF
 
         # EXIT
         if key == ord('q'):
-            ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = absolute_path("results", "yolo_outputs", f"output_{ts}.jpg")
-            cv2.imwrite(save_path, img)
-            speak("Exiting YOLO module.")
+            # Nothing detected → nothing new to save (skip the encode + write)
+            if annotated is not None:
+                ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+                cv2.imwrite(os.path.join(OUTPUT_DIR, f"output_{ts}.jpg"), annotated)
+            _cancel_detect()
+            end_speech("Exiting YOLO module.")
             break
 
-        # YOLO DETECTION
-        if key == ord('y'):
+        # YOLO DETECTION — never blocks the UI: the worker's result is
+        # picked up on whichever tick it is ready
+        if key == ord('y') and not y_pending:
+            y_pending = True
             t0 = time.time()
 
-            results = model.predict(img, verbose=False)
-
-            # YOLO returns RGB → convert to BGR for cv2
-            annotated = results[0].plot()
-            annotated_bgr = cv2.cvtColor(annotated, cv2.COLOR_RGB2BGR)
-            display_frame = annotated_bgr
+        if y_pending and results_future.done():
+            y_pending = False
 
-            classes = [box.cls[0] for box in results[0].boxes] if results[0].boxes else []
-            desc = describe_yolo(classes, results[0].names)
-            pos_desc = positional_descriptions(results)
+            try:
+                annotated, display_frame, desc, pos_desc = results_future.result()
+            except Exception as e:
+                log("YOLO", fp, f"Detection failed: {e}")
+                say("Detection failed.")
+                # Retry on the next Y press
+                results_future = _submit_detect(_detect, img)
+                continue
+            dirty = True
 
             duration = round(time.time() - t0, 2)
             log("YOLO", fp, f"{desc} | {pos_desc}", duration)
 
-            speak(desc + " " + pos_desc)
+            say(desc + " " + pos_desc)
 
         # GEMINI SUMMARY
         if key == ord('g'):
             threading.Thread(
                 target=gemini_scene,
-                args=(fp,),
+                args=(fp, raw_bytes),
                 daemon=True
             ).start()
 
@@ -212,3 +636,5 @@ def main():
 # ================================================================
 if __name__ == "__main__":
     main()
+    # Let the last message (e.g. "Exiting YOLO module.") finish
+    flush_speech()